@@ -1,13 +1,17 @@
 #!/usr/bin/env python
 import sys
 
-import pytoml as toml
+try:
+    import tomllib
+except ImportError:
+    import tomli as tomllib
 
 if __name__ == "__main__":
     filenames = sys.argv[1:]
     for filename in filenames:
         try:
-            data = toml.load(open(filename, 'r'))
+            with open(filename, 'rb') as fin:
+                data = tomllib.load(fin)
         except:
             print(f"Error in {filename}!")
             raise
@@ -5,6 +5,8 @@ from prompt_toolkit.styles import Style
 
 class Command:
 
+    __slots__ = ('game', 'session', 'player_view')
+
     keywords = ['command']
 
     style = Style.from_dict({
@@ -17,11 +19,6 @@ class Command:
         self.session = session
         self.player_view = player_view
 
-        for kw in self.keywords:
-            game.commands[kw] = self
-
-        print("Registered "+self.__class__.__name__)
-
     def get_suggestions(self, words):
         return []
 
@@ -32,10 +29,28 @@ class Command:
         help_text = getattr(self, 'help_text', None)
         if help_text:
             divider = "-" * len(keyword)
-            print(help_text.format(**locals()).strip())
+            print(help_text.format(keyword=keyword, divider=divider).strip())
         else:
             print(f"No help text available for: {keyword}")
 
+    def get_targets_and_amount(self, args):
+        if len(args) < 2:
+            print("Need a target and an amount of HP.")
+            return None, None
+
+        try:
+            amount = int(args[-1])
+        except ValueError:
+            print("Need an amount of HP.")
+            return None, None
+
+        targets = self.game.combat.get_targets(args[:-1])
+        if not targets:
+            print(f"No targets found from `{args[:-1]}`")
+            return None, None
+
+        return targets, amount
+
     def print(self, content):
         print_formatted_text(HTML(content), style=self.style)
 
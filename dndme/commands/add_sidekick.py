@@ -4,6 +4,8 @@ from dndme.models import Character
 
 class AddSidekick(Command):
 
+    __slots__ = ()
+
     keywords = ['sidekick']
 
     help_text = """{keyword}
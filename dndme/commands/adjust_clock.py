@@ -4,6 +4,8 @@ from dndme.commands import Command
 
 class AdjustClock(Command):
 
+    __slots__ = ()
+
     keywords = ['clock', 'time']
     help_text = """{keyword}
 {divider}
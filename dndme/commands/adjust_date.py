@@ -5,6 +5,8 @@ from dndme.gametime import Date
 
 class AdjustDate(Command):
 
+    __slots__ = ()
+
     keywords = ['date']
     help_text = """{keyword}
 {divider}
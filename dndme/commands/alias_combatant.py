@@ -3,6 +3,8 @@ from dndme.commands import Command
 
 class AliasCombatant(Command):
 
+    __slots__ = ()
+
     keywords = ['alias']
     help_text = """{keyword}
 {divider}
@@ -1,3 +1,4 @@
+import ast
 import re
 from dndme.commands import Command
 
@@ -6,6 +7,8 @@ number_re = re.compile(r"([+\-]){0,1}(\d+)")
 
 class AlterCombatant(Command):
 
+    __slots__ = ()
+
     keywords = ['alter']
     help_text = """{keyword}
 {divider}
@@ -31,7 +34,7 @@ Numerical values can either be set directly or include math operators including
 Properly-formatted Python lists, dictionaries, sets, and tuples can also be
 assigned:
 
-    {keyword} Frodo senses {"darkvision": 50, "perception": 14}
+    {keyword} Frodo senses {{"darkvision": 50, "perception": 14}}
 
 ** USE WITH CAUTION **
 
@@ -84,12 +87,13 @@ It's also possible to fix them with it, but that can be really annoying.
                 new_value = getattr(target, attribute) * int(value[1:])
             elif value.startswith("/"):
                 new_value = int(getattr(target, attribute) / int(value[1:]))
-            elif value.isdigit():
-                new_value = int(value)
             elif value.startswith("[") or value.startswith("{"):
                 new_value = ast.literal_eval(value)
             else:
-                new_value = value
+                try:
+                    new_value = int(value)
+                except ValueError:
+                    new_value = value
         except (SyntaxError, TypeError, ValueError):
             print(f"Invalid value: {value}")
             return
@@ -3,6 +3,8 @@ from dndme.commands import Command
 
 class CastSpell(Command):
 
+    __slots__ = ()
+
     keywords = ['cast']
     help_text = """{keyword}
 {divider}
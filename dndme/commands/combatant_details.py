@@ -6,6 +6,8 @@ from dndme.commands import Command
 
 class CombatantDetails(Command):
 
+    __slots__ = ()
+
     keywords = ['details']
     help_text = """{keyword}
 {divider}
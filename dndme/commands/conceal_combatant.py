@@ -3,6 +3,8 @@ from dndme.commands import Command
 
 class ConcealCombatant(Command):
 
+    __slots__ = ()
+
     keywords = ['conceal']
     help_text = """{keyword}
 {divider}
@@ -1,9 +1,10 @@
 from dndme.commands import Command
-from dndme.commands.defeat_monster import DefeatMonster
 
 
 class DamageCombatant(Command):
 
+    __slots__ = ()
+
     keywords = ['damage', 'hurt', 'hit']
     help_text = """{keyword}
 {divider}
@@ -24,21 +25,11 @@ Examples:
         return sorted(set(combat.combatant_names) - set(names_already_chosen))
 
     def do_command(self, *args):
-        if len(args) < 2:
-            print("Need a target and an amount of HP.")
-            return
-
-        try:
-            amount = int(args[-1])
-        except ValueError:
-            print("Need an amount of HP.")
+        targets, amount = self.get_targets_and_amount(args)
+        if not targets:
             return
 
         combat = self.game.combat
-        targets = combat.get_targets(args[:-1])
-        if not targets:
-            print(f"No targets found from `{args[:-1]}`")
-            return
 
         for target in targets:
             target.cur_hp -= amount
@@ -52,4 +43,4 @@ Examples:
                         "mark as defeated? [Y]: ")
                         or 'y').lower() != 'y':
                     continue
-                DefeatMonster.do_command(self, target.name)
\ No newline at end of file
+                self.game.commands['defeat'].do_command(target.name)
\ No newline at end of file
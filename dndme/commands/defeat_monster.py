@@ -3,6 +3,8 @@ from dndme.commands import Command
 
 class DefeatMonster(Command):
 
+    __slots__ = ()
+
     keywords = ['defeat']
     help_text = """{keyword}
 {divider}
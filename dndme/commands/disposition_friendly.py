@@ -3,6 +3,8 @@ from dndme.commands import Command
 
 class DispositionFriendly(Command):
 
+    __slots__ = ()
+
     keywords = ['friendly']
     help_text = """{keyword}
 {divider}
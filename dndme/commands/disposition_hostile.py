@@ -3,6 +3,8 @@ from dndme.commands import Command
 
 class DispositionHostile(Command):
 
+    __slots__ = ()
+
     keywords = ['hostile']
     help_text = """{keyword}
 {divider}
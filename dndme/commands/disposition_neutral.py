@@ -3,6 +3,8 @@ from dndme.commands import Command
 
 class DispositionNeutral(Command):
 
+    __slots__ = ()
+
     keywords = ['neutral']
     help_text = """{keyword}
 {divider}
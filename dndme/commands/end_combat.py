@@ -1,13 +1,12 @@
 import math
 from prompt_toolkit.completion import WordCompleter
 from dndme.commands import Command
-from dndme.commands.remove_combatant import RemoveCombatant
-from dndme.commands.show import Show
-from dndme.commands.stash_combatant import StashCombatant
 
 
 class EndCombat(Command):
 
+    __slots__ = ()
+
     keywords = ['end']
     help_text = """{keyword}
 {divider}
@@ -25,7 +24,7 @@ Usage: {keyword}
         cur_turn = combat.tm.cur_turn
 
         combat.tm = None
-        Show.show_defeated(self)
+        self.game.commands['show'].show_defeated()
         combat.defeated = []
 
         # Allow some leftover monsters to remain in the combat group;
@@ -38,9 +37,9 @@ Usage: {keyword}
                 completer=choices
             ).lower()
             if choice in ('r', 'remove'):
-                RemoveCombatant.do_command(self, monster.name)
+                self.game.commands['remove'].do_command(monster.name)
             elif choice in ('s', 'stash'):
-                StashCombatant.do_command(self, monster.name)
+                self.game.commands['stash'].do_command(monster.name)
             else:
                 print(f"Okay, keeping {monster.name}")
 
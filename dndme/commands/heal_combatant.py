@@ -3,6 +3,8 @@ from dndme.commands import Command
 
 class HealCombatant(Command):
 
+    __slots__ = ()
+
     keywords = ['heal']
     help_text = """{keyword}
 {divider}
@@ -23,24 +25,8 @@ Examples:
         return sorted(set(combat.combatant_names) - set(names_already_chosen))
 
     def do_command(self, *args):
-        if len(args) < 2:
-            print("Need a target and an amount of HP.")
-            return
-
-        try:
-            amount = int(args[-1])
-        except ValueError:
-            print("Need an amount of HP.")
-            return
-
-        if len(args) < 2:
-            print("Need a target and an amount of HP.")
-            return
-
-        combat = self.game.combat
-        targets = combat.get_targets(args[:-1])
+        targets, amount = self.get_targets_and_amount(args)
         if not targets:
-            print(f"No targets found from `{args[:-1]}`")
             return
 
         for target in targets:
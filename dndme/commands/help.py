@@ -1,9 +1,10 @@
 from dndme.commands import Command
-from dndme.commands.list_commands import ListCommands
 
 
 class Help(Command):
 
+    __slots__ = ()
+
     keywords = ['help']
     help_text = """{keyword}
 {divider}
@@ -13,7 +14,7 @@ Usage: {keyword} <command>
 """
 
     def get_suggestions(self, words):
-        return list(sorted(self.game.commands.keys()))
+        return self.game.command_keywords
 
     def do_command(self, *args):
         if not args:
@@ -29,4 +30,4 @@ Usage: {keyword} <command>
 
     def show_help_text(self, keyword):
         super().show_help_text(keyword)
-        ListCommands.do_command(self, *[])
\ No newline at end of file
+        self.game.commands['commands'].do_command()
\ No newline at end of file
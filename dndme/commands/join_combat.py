@@ -1,12 +1,11 @@
 from dndme.commands import Command
 from dndme.commands import convert_to_int, convert_to_int_or_dice_expr
-from dndme.commands.show import Show
-from dndme.commands.stash_combatant import StashCombatant
-from dndme.commands.switch_combat import SwitchCombat
 
 
 class JoinCombat(Command):
 
+    __slots__ = ()
+
     keywords = ['join']
     help_text = """{keyword}
 {divider}
@@ -54,7 +53,7 @@ Example: {keyword} 1 Aragorn Gimli Legolas
 
         if source_combat.defeated:
             print("Monsters were defeated:\n")
-            Show.show_defeated(self)
+            self.game.commands['show'].show_defeated()
 
         targets = source_combat.get_targets(target_names)
         if not targets:
@@ -89,12 +88,12 @@ Example: {keyword} 1 Aragorn Gimli Legolas
 
         if source_combat.monsters and not source_combat.characters:
             print("Monsters remain, stashing them:\n")
-            StashCombatant.do_command(self,
+            self.game.commands['stash'].do_command(
                     *list(source_combat.monsters.keys()))
 
         if not source_combat.characters and not source_combat.monsters:
             print("Combat group is empty; switching...")
-            SwitchCombat.do_command(self)
+            self.game.commands['switch'].do_command()
             self.game.combats.remove(source_combat)
 
         if source_combat.tm:
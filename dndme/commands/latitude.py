@@ -2,6 +2,8 @@ from dndme.commands import Command
 
 class Latitude(Command):
 
+    __slots__ = ()
+
     keywords = ['latitude', 'lat']
     help_text = """{keyword}
 {divider}
@@ -3,6 +3,8 @@ from dndme.commands import Command
 
 class ListCommands(Command):
 
+    __slots__ = ()
+
     keywords = ['commands']
     help_text = """{keyword}
 {divider}
@@ -13,5 +15,5 @@ Usage: {keyword}
 
     def do_command(self, *args):
         self.print("<x>Available commands:</x>\n")
-        for keyword in list(sorted(self.game.commands.keys())):
+        for keyword in self.game.command_keywords:
             print('*', keyword)
\ No newline at end of file
@@ -6,6 +6,8 @@ from dndme.loaders import EncounterLoader, MonsterLoader, PartyLoader
 
 class Load(Command):
 
+    __slots__ = ('monster_loader',)
+
     keywords = ['load']
     help_text = """{keyword}
 {divider}
@@ -32,32 +34,41 @@ Example:
     {keyword} encounter moria
 """
 
+    subcommands = {
+        'party': 'load_party',
+        'encounter': 'load_encounter',
+        'monster': 'load_monster',
+    }
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        # Shared so monster files are only re-parsed when they change;
+        # each load refreshes it once before looking monsters up
+        self.monster_loader = MonsterLoader()
+
     def get_suggestions(self, words):
         if len(words) == 2:
-            return ['encounter', 'monster', 'party']
+            return sorted(self.subcommands)
         if len(words) == 3 and words[1] == 'monster':
-            monster_loader = MonsterLoader()
-            return monster_loader.get_available_monster_keys()
+            return self.monster_loader.get_available_monster_keys()
 
     def do_command(self, *args):
         if not args:
             print("Load what?")
             return
-        if args[0] == 'party':
-            self.load_party()
-        elif args[0] == 'encounter':
-            self.load_encounter(args[1:])
-        elif args[0] == 'monster' and len(args) == 2:
-            self.load_monster(args[-1])
-        else:
+        try:
+            loader = getattr(self, self.subcommands[args[0]])
+        except KeyError:
             print("Sorry; can't load that.")
+            return
+        loader(*args[1:])
 
-    def load_party(self):
+    def load_party(self, *args):
         party_loader = PartyLoader(self.game.party_file)
         party = party_loader.load(self.game.combat)
         print("OK; loaded {} characters".format(len(party)))
 
-    def load_encounter(self, args):
+    def load_encounter(self, *args):
 
         def prompt_count(count, monster_name="monsters"):
             count = self.safe_input(
@@ -77,16 +88,16 @@ Example:
             print(f"Adding to turn order at: {roll}")
             return roll
 
-        monster_loader = MonsterLoader()
         encounter_loader = EncounterLoader(
                 self.game.encounters_dir,
-                monster_loader,
+                self.monster_loader,
                 self.game.combat,
                 count_resolver=prompt_count,
                 initiative_resolver=prompt_initiative)
 
         filter_string = f"*{args[0].lower()}*" if args else "*"
-        encounters = [e for e in encounter_loader.get_available_encounters()
+        encounters = [(filename, e) for filename, e
+                in encounter_loader.get_available_encounter_headers()
                 if fnmatch(e.name.lower(), filter_string) or
                 fnmatch(e.location.lower(), filter_string)]
 
@@ -96,21 +107,28 @@ Example:
 
         # prompt to pick an encounter
         print("Available encounters:\n")
-        for i, encounter in enumerate(encounters, 1):
+        for i, (_, encounter) in enumerate(encounters, 1):
             print(f"{i}: {encounter.name} ({encounter.location})")
 
         pick = self.safe_input("Load encounter", converter=convert_to_int)
         pick = pick - 1
-        if pick < 0 or pick > len(encounters):
+        if pick < 0 or pick >= len(encounters):
             print("Invalid encounter.")
             return
 
-        encounter = encounters[pick]
+        # Only the picked encounter needs its monster groups parsed
+        filename, _ = encounters[pick]
+        encounter = encounter_loader.load_file(filename)
+        self.monster_loader.refresh()
         monsters = encounter_loader.load(encounter)
         print(f"Loaded encounter: {encounter.name}"
                 f" with {len(monsters)} monsters")
 
-    def load_monster(self, monster_name):
+    def load_monster(self, *args):
+        if len(args) != 1:
+            print("Sorry; can't load that.")
+            return
+        monster_name = args[0]
 
         def prompt_initiative(monster):
             # prompt to add the monsters to initiative order
@@ -123,11 +141,11 @@ Example:
             print(f"Adding to turn order at: {roll}")
             return roll
 
-        monster_loader = MonsterLoader()
         count = self.safe_input(
                 "Number of monsters",
                 converter=convert_to_int_or_dice_expr)
-        monsters = monster_loader.load(monster_name, count=count)
+        self.monster_loader.refresh()
+        monsters = self.monster_loader.load(monster_name, count=count)
 
         if not monsters:
             print("No monsters loaded. Might be a data problem?")
@@ -136,10 +154,9 @@ Example:
         #TODO: this is a cheat and really bad and we should clean it up
         encounter_loader = EncounterLoader(
                 self.game.encounters_dir,
-                monster_loader,
+                self.monster_loader,
                 self.game.combat,
                 initiative_resolver=prompt_initiative)
-        encounter_loader._set_hp([], monsters)
         encounter_loader._set_names([], monsters)
         encounter_loader._add_to_combat(self.game.combat, monsters)
         for monster in monsters:
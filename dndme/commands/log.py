@@ -7,6 +7,8 @@ from dndme.commands import Command
 
 class Log(Command):
 
+    __slots__ = ('log_buf', 'log_file')
+
     keywords = ['log']
     help_text = """{keyword}
 {divider}
@@ -3,6 +3,8 @@ from dndme.commands import Command
 
 class Message(Command):
 
+    __slots__ = ()
+
     keywords = ['message']
     help_text = """{keyword}
 {divider}
@@ -3,6 +3,8 @@ from dndme.commands import Command
 
 class MoveCombatant(Command):
 
+    __slots__ = ()
+
     keywords = ['move']
     help_text = """{keyword}
 {divider}
@@ -1,9 +1,10 @@
 from dndme.commands import Command
-from dndme.commands.show import Show
 
 
 class NextTurn(Command):
 
+    __slots__ = ()
+
     keywords = ['next']
     help_text = """{keyword}
 {divider}
@@ -31,5 +32,5 @@ Usage: {keyword}
 
             turn = next(combat.tm.turns)
             combat.tm.cur_turn = turn
-            Show.show_turn(self)
+            self.game.commands['show'].show_turn()
             self.game.changed = True
\ No newline at end of file
@@ -5,6 +5,8 @@ from dndme.commands import Command
 
 class Quit(Command):
 
+    __slots__ = ()
+
     keywords = ['quit', 'exit']
     help_text = """{keyword}
 {divider}
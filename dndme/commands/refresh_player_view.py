@@ -4,6 +4,8 @@ from dndme.commands import Command
 
 class RefreshPlayerView(Command):
 
+    __slots__ = ()
+
     keywords = ['refresh']
     help_text = """{keyword}
 {divider}
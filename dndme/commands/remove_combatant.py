@@ -3,6 +3,8 @@ from dndme.commands import Command
 
 class RemoveCombatant(Command):
 
+    __slots__ = ()
+
     keywords = ['remove']
     help_text = """{keyword}
 {divider}
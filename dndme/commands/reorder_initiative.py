@@ -3,6 +3,8 @@ from dndme.commands import Command
 
 class ReorderInitiative(Command):
 
+    __slots__ = ()
+
     keywords = ['reorder']
     help_text = """{keyword}
 {divider}
@@ -3,6 +3,8 @@ from dndme.commands import Command
 
 class RevealCombatant(Command):
 
+    __slots__ = ()
+
     keywords = ['reveal']
     help_text = """{keyword}
 {divider}
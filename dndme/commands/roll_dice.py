@@ -4,6 +4,8 @@ from dndme.dice import roll_dice, roll_dice_expr
 
 class RollDice(Command):
 
+    __slots__ = ()
+
     keywords = ['roll', 'dice']
     help_text = """{keyword}
 {divider}
@@ -5,6 +5,8 @@ from dndme.writers import PartyWriter
 
 class Save(Command):
 
+    __slots__ = ()
+
     keywords = ['save']
 
     help_text = """{keyword}
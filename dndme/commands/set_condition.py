@@ -4,6 +4,8 @@ from dndme.commands import Command
 
 class SetCondition(Command):
 
+    __slots__ = ()
+
     keywords = ['set']
     help_text = """{keyword}
 {divider}
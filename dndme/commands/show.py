@@ -1,9 +1,13 @@
 from math import floor, inf
+from operator import itemgetter
+import sys
 from dndme.commands import Command
 
 
 class Show(Command):
 
+    __slots__ = ()
+
     keywords = ['show']
     help_text = """{keyword}
 {divider}
@@ -21,37 +25,39 @@ Summary: Show various things:
 Usage: {keyword} <what>
 """
 
+    subcommands = {
+        'party': 'show_party',
+        'monsters': 'show_monsters',
+        'stash': 'show_stash',
+        'defeated': 'show_defeated',
+        'turn': 'show_turn',
+        'initiative': 'show_turns',
+        'order': 'show_turns',
+        'turns': 'show_turns',
+        'combats': 'show_combats',
+    }
+
     def get_suggestions(self, words):
         if len(words) == 2:
-            return ['monsters', 'party', 'stash', 'defeated', 'turn',
-                    'initiative', 'order', 'turns', 'combats']
+            return list(self.subcommands)
 
     def do_command(self, *args):
         if not args:
             print("Show what?")
             return
-        if args[0] == 'party':
-            self.show_party()
-        elif args[0] == 'monsters':
-            self.show_monsters()
-        elif args[0] == 'stash':
-            self.show_stash()
-        elif args[0] == 'defeated':
-            self.show_defeated()
-        elif args[0] == 'turn':
-            self.show_turn()
-        elif args[0] in ('initiative', 'order', 'turns'):
-            self.show_turns()
-        elif args[0] == 'combats':
-            self.show_combats()
-        else:
+        try:
+            show = getattr(self, self.subcommands[args[0]])
+        except KeyError:
             print("Sorry; can't show that.")
+            return
+        show()
 
     def show_party(self):
         combat = self.game.combat
-        party = list(sorted(combat.characters.items()))
-        for name, character in party:
-            print(f"{name:20}"
+        lines = []
+        for name, character in sorted(combat.characters.items(),
+                key=itemgetter(0)):
+            lines.append(f"{name:20}"
                     f"\tHP: {character.cur_hp:0>2}/{character.max_hp:0>2}"
                     f"\tAC: {character.ac:0>2}"
                     f"\tPer: {character.senses['perception']:0>2}"
@@ -60,17 +66,20 @@ Usage: {keyword} <what>
                 conds = ', '.join([f"{x}:{y}"
                         if y != inf else x
                         for x, y in character.conditions.items()])
-                print(f"    Conditions: {conds}")
+                lines.append(f"    Conditions: {conds}")
+        if lines:
+            sys.stdout.write('\n'.join(lines) + '\n')
 
     def show_monsters(self):
         combat = self.game.combat
-        monsters = list(sorted(combat.monsters.items()))
-        for name, monster in monsters:
+        lines = []
+        for name, monster in sorted(combat.monsters.items(),
+                key=itemgetter(0)):
             formatted_name = name
             if monster.alias:
                 formatted_name = f"{name}:{monster.alias}"
             vis_icon = "(+) " if monster.visible_in_player_view else "( ) "
-            print(f"{vis_icon}{formatted_name[:30]:30}"
+            lines.append(f"{vis_icon}{formatted_name[:30]:30}"
                     f"\tHP: {monster.cur_hp:0>2}/{monster.max_hp:0>2}"
                     f"\tAC: {monster.ac:0>2}"
                     f"\tPer: {monster.senses['perception']:0>2}"
@@ -80,7 +89,9 @@ Usage: {keyword} <what>
                 conds = ', '.join([f"{x}:{y}"
                         if y != inf else x
                         for x, y in monster.conditions.items()])
-                print(f"    Conditions: {conds}")
+                lines.append(f"    Conditions: {conds}")
+        if lines:
+            sys.stdout.write('\n'.join(lines) + '\n')
 
     def show_stash(self):
         if not self.game.stash:
@@ -123,8 +134,11 @@ Usage: {keyword} <what>
         if not combat.tm:
             print("No turn in progress.")
             return
-        for roll, combatants in combat.tm.turn_order:
-            print(f"{roll}: {', '.join([x.name for x in combatants])}")
+        turn_order = combat.tm.turn_order
+        if turn_order:
+            sys.stdout.write('\n'.join(
+                    f"{roll}: {', '.join([x.name for x in combatants])}"
+                    for roll, combatants in turn_order) + '\n')
 
     def show_combats(self):
         for i, combat in enumerate(self.game.combats, 1):
@@ -4,6 +4,8 @@ from dndme.commands import Command
 
 class ShowCalendar(Command):
 
+    __slots__ = ()
+
     keywords = ['calendar', 'cal']
     help_text = """{keyword}
 {divider}
@@ -4,6 +4,8 @@ from dndme.gametime import Date
 
 class ShowMoon(Command):
 
+    __slots__ = ()
+
     keywords = ['moon', 'moons']
     help_text = """{keyword}
 {divider}
@@ -3,6 +3,8 @@ from dndme.commands import Command
 
 class ShowSun(Command):
 
+    __slots__ = ()
+
     keywords = ['sun', 'times']
     help_text = """{keyword}
 {divider}
@@ -1,12 +1,13 @@
 from dndme.commands import Command
 from dndme.commands import convert_to_int, convert_to_int_or_dice_expr
-from dndme.commands.next_turn import NextTurn
 from dndme.initiative import TurnManager
 from dndme.models import Combat
 
 
 class SplitCombat(Command):
 
+    __slots__ = ()
+
     keywords = ['split']
     help_text = """{keyword}
 {divider}
@@ -83,4 +84,4 @@ Example: {keyword} Frodo Sam
         current_combatant = source_combat.current_combatant
         if current_combatant and \
                 current_combatant in dest_combat.combatant_names:
-            NextTurn.do_command(self)
\ No newline at end of file
+            self.game.commands['next'].do_command()
\ No newline at end of file
@@ -1,3 +1,4 @@
+import sys
 from dndme.commands import Command
 from dndme.commands import convert_to_int, convert_to_int_or_dice_expr
 from dndme.initiative import TurnManager
@@ -5,6 +6,8 @@ from dndme.initiative import TurnManager
 
 class StartCombat(Command):
 
+    __slots__ = ()
+
     keywords = ['start']
     help_text = """{keyword}
 {divider}
@@ -40,9 +43,10 @@ Usage: {keyword}
             combat.tm.add_combatant(character, roll)
             print(f"Added to turn order in {roll}\n")
 
-        print("\nBeginning combat with: ")
+        lines = ["\nBeginning combat with: "]
         for roll, combatants in combat.tm.turn_order:
-            print(f"{roll}: {', '.join([x.name for x in combatants])}")
+            lines.append(f"{roll}: {', '.join([x.name for x in combatants])}")
+        sys.stdout.write('\n'.join(lines) + '\n')
 
         combat.tm.turns = combat.tm.generate_turns()
         self.game.changed = True
\ No newline at end of file
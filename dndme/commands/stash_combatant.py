@@ -3,6 +3,8 @@ from dndme.commands import Command
 
 class StashCombatant(Command):
 
+    __slots__ = ()
+
     keywords = ['stash']
     help_text = """{keyword}
 {divider}
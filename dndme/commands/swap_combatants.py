@@ -3,6 +3,8 @@ from dndme.commands import Command
 
 class SwapCombatants(Command):
 
+    __slots__ = ()
+
     keywords = ['swap']
     help_text = """{keyword}
 {divider}
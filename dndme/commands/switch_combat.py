@@ -1,9 +1,10 @@
 from dndme.commands import Command
-from dndme.commands.show import Show
 
 
 class SwitchCombat(Command):
 
+    __slots__ = ()
+
     keywords = ['switch']
     help_text = """{keyword}
 {divider}
@@ -36,5 +37,5 @@ Examples:
             self.game.combat = self.game.combats[switch_to]
 
         print(f"Okay; switched to combat {switch_to + 1}")
-        Show.show_party(self)
+        self.game.commands['show'].show_party()
         self.game.changed = True
\ No newline at end of file
@@ -3,6 +3,8 @@ from dndme.commands import Command
 
 class UnaliasCombatant(Command):
 
+    __slots__ = ()
+
     keywords = ['unalias']
     help_text = """{keyword}
 {divider}
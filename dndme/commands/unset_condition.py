@@ -3,6 +3,8 @@ from dndme.commands import Command
 
 class UnsetCondition(Command):
 
+    __slots__ = ()
+
     keywords = ['unset']
     help_text = """{keyword}
 {divider}
@@ -4,6 +4,8 @@ from dndme.commands import convert_to_int, convert_to_int_or_dice_expr
 
 class UnstashCombatant(Command):
 
+    __slots__ = ()
+
     keywords = ['unstash']
     help_text = """{keyword}
 {divider}
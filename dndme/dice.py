@@ -46,3 +46,14 @@ def roll_dice_expr(value):
     sides = int(sides)
     modifier = int(modifier or 0)
     return roll_dice(times, sides, modifier=modifier)
+
+
+def int_or_roll(value):
+    """
+    Get an int from a value that is either a number or a dice expression,
+    rolling the dice if need be; e.g. 12, "12", or "2d6+3"
+    """
+    try:
+        return int(value)
+    except ValueError:
+        return roll_dice_expr(value)
@@ -1,13 +1,65 @@
-import glob
+from concurrent.futures import ThreadPoolExecutor
+import copy
+import os
 import re
 import uuid
 
-import pytoml as toml
+try:
+    import tomllib
+except ImportError:
+    import tomli as tomllib
 
-from dndme.dice import dice_expr, roll_dice, roll_dice_expr
+from dndme.dice import dice_expr, int_or_roll, roll_dice, roll_dice_expr
 from dndme.models import Character, Encounter, Monster
 
 
+def _toml_file_entries(dirname):
+    # Like sorted(glob(f"{dirname}/*.toml")), minus the pattern matching
+    try:
+        with os.scandir(dirname) as entries:
+            return sorted((entry for entry in entries
+                    if entry.name.endswith('.toml')
+                    and not entry.name.startswith('.')
+                    and entry.is_file()),
+                    key=lambda entry: entry.name)
+    except FileNotFoundError:
+        return []
+
+
+def _toml_files(dirname):
+    return [entry.path for entry in _toml_file_entries(dirname)]
+
+
+def _read_toml(filename):
+    # Slurp the whole file in one read, then parse it from memory
+    with open(filename, 'rb') as fin:
+        return tomllib.loads(fin.read().decode())
+
+
+def _read_toml_header(filename):
+    # Parse only the top-level keys that come before the first table;
+    # if the cut lands inside a multi-line string or array, the header
+    # won't parse, so fall back to parsing the whole file
+    with open(filename, 'rb') as fin:
+        lines = []
+        for line in fin:
+            if line.startswith(b'['):
+                break
+            lines.append(line)
+        try:
+            return tomllib.loads(b''.join(lines).decode())
+        except tomllib.TOMLDecodeError:
+            fin.seek(0)
+            return tomllib.loads(fin.read().decode())
+
+
+def _read_toml_files(filenames, reader=_read_toml):
+    # Overlap the file reads, which helps a lot on slow/network mounts;
+    # results come back in the same order as the filenames
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        return list(executor.map(reader, filenames))
+
+
 class EncounterLoader:
 
     def __init__(self, base_dir, monster_loader, combat,
@@ -19,12 +71,27 @@ class EncounterLoader:
         self.count_resolver = count_resolver
         self.initiative_resolver = initiative_resolver
 
+    def get_available_encounter_files(self):
+        return _toml_files(self.base_dir)
+
     def get_available_encounters(self):
-        available_encounter_files = glob.glob(f"{self.base_dir}/*.toml")
-        encounters = [Encounter(**toml.load(open(filename, 'r')))
-                for filename in sorted(available_encounter_files)]
+        available_encounter_files = self.get_available_encounter_files()
+        encounters = [Encounter(**data) for data in
+                _read_toml_files(available_encounter_files)]
         return encounters
 
+    def get_available_encounter_headers(self):
+        # Just the name, location, and notes of each encounter, paired
+        # with its filename; use load_file() to get the full encounter
+        available_encounter_files = self.get_available_encounter_files()
+        headers = _read_toml_files(available_encounter_files,
+                reader=_read_toml_header)
+        return [(filename, Encounter(**data)) for filename, data
+                in zip(available_encounter_files, headers)]
+
+    def load_file(self, filename):
+        return Encounter(**_read_toml(filename))
+
     def load(self, encounter):
         monster_groups = {}
         for key, group in encounter.groups.items():
@@ -39,10 +106,10 @@ class EncounterLoader:
 
     def _load_group(self, group, monster_groups):
         count = self._determine_count(group, monster_groups)
-        monsters = self.monster_loader.load(group['monster'], count=count)
+        monsters = self.monster_loader.load(group['monster'], count=count,
+                max_hp=group.get('max_hp'))
         self._set_names(group, monsters)
         self._set_stats(group, monsters)
-        self._set_hp(group, monsters)
         self._set_armor(group, monsters)
         self._set_alignment(group, monsters)
         self._set_race(group, monsters)
@@ -126,30 +193,6 @@ class EncounterLoader:
             if 'cha' in group:
                 monster.cha = group['cha']
 
-    def _set_hp(self, group, monsters):
-        # Are we overriding max hp?
-        if 'max_hp' in group:
-
-            # Have we got a list of max hp?
-            if hasattr(group['max_hp'], 'append') and \
-                    len(group['max_hp']) == len(monsters):
-                for i, monster in enumerate(monsters):
-                    monster.max_hp = group['max_hp'][i]
-                    monster.cur_hp = monster.max_hp
-
-            # Have we got a single int or dice expression?
-            elif hasattr(group['max_hp'], 'real') or \
-                    hasattr(group['max_hp'], 'join'):
-                for monster in monsters:
-                    monster.max_hp = group['max_hp']
-                    monster.cur_hp = monster.max_hp
-
-        # Not overriding max hp at all
-        else:
-            for monster in monsters:
-                monster.max_hp = monster._max_hp
-                monster.cur_hp = monster.max_hp
-
     def _set_armor(self, group, monsters):
         if 'armor' in group:
             for monster in monsters:
@@ -239,34 +282,78 @@ class EncounterLoader:
 class MonsterLoader:
 
     def __init__(self):
-        pass
-
-    def load(self, monster_name, count=1):
-        # TODO: hey maybe make this more efficient, yeah?
-
-        monster_files = self.get_available_monster_files()
-        monsters = []
+        self._monster_data = None
+        self._monster_files = None
 
-        for filename in monster_files:
-            monster = toml.load(open(filename, 'r'))
-
-            if monster['name'] != monster_name:
+    def refresh(self):
+        # Re-parse only if monster files were added, removed, or edited
+        monster_files = []
+        for entry in self._get_available_monster_file_entries():
+            try:
+                monster_files.append((entry.path, entry.stat().st_mtime_ns))
+            except FileNotFoundError:
+                # Deleted since the directory was scanned
                 continue
 
-            for i in range(count):
-                monsters.append(Monster(**monster))
-            break
+        if monster_files != self._monster_files:
+            self._monster_data = {}
+            filenames = [filename for filename, _ in monster_files]
+            for monster in _read_toml_files(filenames):
+                self._monster_data.setdefault(monster['name'], monster)
+            self._monster_files = monster_files
+
+    def load(self, monster_name, count=1, max_hp=None):
+        monster = self.get_monster_data().get(monster_name)
+        if not monster:
+            return []
+
+        # Have we got a list of max hp?
+        if hasattr(max_hp, 'append') and len(max_hp) == count:
+            hp_values = max_hp
+        # Have we got a single int or dice expression?
+        elif hasattr(max_hp, 'real') or hasattr(max_hp, 'join'):
+            hp_values = [max_hp] * count
+        # Not overriding max hp at all
+        else:
+            hp_values = [monster.get('max_hp', 10)] * count
 
+        monsters = []
+        for hp in hp_values:
+            hp = int_or_roll(hp)
+            # Each monster gets its own copy of the template data so that
+            # per-group tweaks (skills, actions, etc.) don't leak between
+            # monsters or back into the cache.
+            data = copy.deepcopy(monster)
+            data.update(max_hp=hp, cur_hp=hp)
+            monsters.append(Monster(**data))
         return monsters
 
+    def get_monster_data(self):
+        # Built on first use; after that only refresh() rescans the files
+        if self._monster_data is None:
+            self.refresh()
+        return self._monster_data
+
+    def _get_available_monster_file_entries(self):
+        try:
+            with os.scandir('content') as entries:
+                content_dirs = sorted(entry.path for entry in entries
+                        if entry.is_dir() and not entry.name.startswith('.'))
+        except FileNotFoundError:
+            return []
+
+        monster_file_entries = []
+        for content_dir in content_dirs:
+            monster_file_entries.extend(
+                    _toml_file_entries(f"{content_dir}/monsters"))
+        return monster_file_entries
+
     def get_available_monster_files(self):
-        monster_files = glob.glob('content/*/monsters/*.toml')
-        return monster_files
+        return [entry.path
+                for entry in self._get_available_monster_file_entries()]
 
     def get_available_monster_keys(self):
-        keys = [re.sub(r".*\/(.*)\.toml", "\\1", fn)
-                for fn in self.get_available_monster_files()]
-        return sorted(keys)
+        return sorted(self.get_monster_data())
 
 
 class PartyLoader:
@@ -275,8 +362,8 @@ class PartyLoader:
         self.filename = filename
 
     def load(self, combat):
-        with open(self.filename, 'r') as fin:
-            party = toml.load(fin)
+        with open(self.filename, 'rb') as fin:
+            party = tomllib.load(fin)
         combat.characters.update(
                 {x['name']: Character(**x) for x in party.values()})
         return party
@@ -35,11 +35,7 @@ class Combatant:
 
     @max_hp.setter
     def max_hp(self, value):
-        try:
-            self._max_hp = int(value)
-        except ValueError:
-            # we have an expression for max hp, so roll it
-            self._max_hp = dice.roll_dice_expr(value)
+        self._max_hp = dice.int_or_roll(value)
         # setting max_hp for the first time? we should set cur_hp too
         if self.cur_hp is None:
             self.cur_hp = self._max_hp
@@ -225,7 +221,7 @@ class Combat:
         return None
 
 
-@attrs
+@attrs(slots=True)
 class Game:
     base_dir = attrib()
     encounters_dir = attrib()
@@ -237,11 +233,13 @@ class Game:
     almanac = attrib()
     latitude = attrib()
 
-    stash = attrib(default={})
-    combats = attrib(default=[])
+    stash = attrib(default=attr_factory(dict))
+    combats = attrib(default=attr_factory(list))
     combat = attrib()
 
-    commands = attrib(default={})
+    commands = attrib(default=attr_factory(dict))
+    _command_keywords = attrib(default=None, init=False, repr=False,
+            cmp=False)
 
     changed = attrib(default=True)
     player_message = attrib(default="")
@@ -252,6 +250,19 @@ class Game:
         self.combats.append(combat)
         return combat
 
+    def register_commands(self, commands):
+        # Register all the commands' keywords in one go
+        self.commands.update({kw: command for command in commands
+                for kw in command.keywords})
+        self._command_keywords = None
+
+    @property
+    def command_keywords(self):
+        # Sorted once and reused; reset whenever a command registers
+        if self._command_keywords is None:
+            self._command_keywords = sorted(self.commands)
+        return self._command_keywords
+
     @property
     def stashed_monster_names(self):
         return [k for k, v in self.stash.items() if hasattr(v, 'mtype')]
@@ -3,7 +3,6 @@ import shutil
 import sys
 
 import click
-import pytoml as toml
 
 base_dir = os.path.normpath(os.path.join( os.path.dirname(__file__), '..'))
 
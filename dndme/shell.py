@@ -6,8 +6,12 @@ import subprocess
 import sys
 import traceback
 
+try:
+    import tomllib
+except ImportError:
+    import tomli as tomllib
+
 import click
-import pytoml as toml
 from prompt_toolkit import HTML
 from prompt_toolkit import PromptSession
 from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
@@ -32,7 +36,8 @@ class DnDCompleter(Completer):
     """
     Simple autocompletion on a list of words.
 
-    :param base_commands: List of base commands.
+    :param commands: Dict mapping command keywords to commands.
+    :param base_commands: Sorted list of base commands.
     :param ignore_case: If True, case-insensitive completion.
     :param meta_dict: Optional dict mapping words to their meta-information.
     :param WORD: When True, use WORD characters.
@@ -43,11 +48,12 @@ class DnDCompleter(Completer):
     :param match_middle: When True, match not only the start, but also in the
                          middle of the word.
     """
-    def __init__(self, commands, ignore_case=False, meta_dict=None,
-                 WORD=False, sentence=False, match_middle=False):
+    def __init__(self, commands, base_commands, ignore_case=False,
+                 meta_dict=None, WORD=False, sentence=False,
+                 match_middle=False):
         assert not (WORD and sentence)
         self.commands = commands
-        self.base_commands = sorted(list(commands.keys()))
+        self.base_commands = base_commands
         self.ignore_case = ignore_case
         self.meta_dict = meta_dict or {}
         self.WORD = WORD
@@ -81,7 +87,7 @@ class DnDCompleter(Completer):
         if len(document_text_list) < 2:
             suggestions = self.base_commands
 
-        elif document_text_list[0] in self.base_commands:
+        elif document_text_list[0] in self.commands:
             command = self.commands[document_text_list[0]]
             suggestions = command.get_suggestions(document_text_list) or []
 
@@ -96,6 +102,7 @@ class DnDCompleter(Completer):
 def load_commands(game, session, player_view):
     path = os.path.join(os.path.dirname(__file__), "commands")
     modules = pkgutil.iter_modules(path=[path])
+    instances = []
 
     for loader, mod_name, ispkg in modules:
         # Ensure that module isn't already loaded
@@ -110,7 +117,10 @@ def load_commands(game, session, player_view):
                 continue
 
             # Create an instance of the class
-            instance = loaded_class(game, session, player_view)
+            instances.append(loaded_class(game, session, player_view))
+
+    game.register_commands(instances)
+    print(f"Registered {len(instances)} commands")
 
 
 @click.command()
@@ -121,13 +131,15 @@ def load_commands(game, session, player_view):
 def main_loop(campaign, player_view):
     # Load the campaign
     campaign_file = f'{base_dir}/campaigns/{campaign}/settings.toml'
-    campaign_data = toml.load(open(campaign_file, 'r'))
+    with open(campaign_file, 'rb') as fin:
+        campaign_data = tomllib.load(fin)
 
     # Load the calendar
     calendar_file = default_calendar_file
     if 'calendar_file' in campaign_data:
         calendar_file = f"{base_dir}/{campaign_data['calendar_file']}"
-    cal_data = toml.load(open(calendar_file, 'r'))
+    with open(calendar_file, 'rb') as fin:
+        cal_data = tomllib.load(fin)
     calendar = Calendar(cal_data)
 
     # Load the clock
@@ -208,6 +220,9 @@ def main_loop(campaign, player_view):
 
     kb = KeyBindings()
 
+    completer = DnDCompleter(commands=game.commands,
+            base_commands=game.command_keywords, ignore_case=True)
+
     if player_view:
         print("Starting player view on port 5000...")
         player_view_manager.start()
@@ -235,8 +250,7 @@ def main_loop(campaign, player_view):
     while True:
         try:
             user_input = session.prompt("> ",
-                completer=DnDCompleter(commands=game.commands,
-                        ignore_case=True),
+                completer=completer,
                 bottom_toolbar=bottom_toolbar,
                 auto_suggest=AutoSuggestFromHistory(),
                 key_bindings=kb,
@@ -246,7 +260,7 @@ def main_loop(campaign, player_view):
             else:
                 user_input = user_input.split()
 
-            command = game.commands.get(user_input[0]) or None
+            command = game.commands.get(user_input[0])
             if not command:
                 print("Unknown command.")
                 continue
@@ -1,4 +1,4 @@
-import pytoml as toml
+import tomli_w
 
 
 class PartyWriter:
@@ -7,6 +7,6 @@ class PartyWriter:
         self.filename = filename
 
     def write(self, party):
-        #print(toml.dumps(party))
-        with open(self.filename, 'w') as fout:
-            toml.dump(party, fout)
+        #print(tomli_w.dumps(party))
+        with open(self.filename, 'wb') as fout:
+            tomli_w.dump(party, fout)
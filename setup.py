@@ -14,7 +14,8 @@ setup(
         'attrs',
         'click',
         'prompt-toolkit',
-        'pytoml',
+        'tomli; python_version < "3.11"',
+        'tomli-w',
         'six',
         'wcwidth',
         'flask',
@@ -0,0 +1,36 @@
+import pytest
+
+from dndme.commands import Command
+from dndme.models import Character, Game, Monster
+
+
+@pytest.fixture
+def command():
+    """Create a testing command with a character and a monster in combat"""
+    game = Game(base_dir='', encounters_dir='', party_file='', log_file=None,
+            calendar=None, clock=None, almanac=None, latitude=0)
+    game.combat.characters['Frodo'] = Character(name='Frodo')
+    game.combat.monsters['orc'] = Monster(name='orc')
+    return Command(game, None, None)
+
+
+def test_get_targets_and_amount(command):
+    targets, amount = command.get_targets_and_amount(('Frodo', 'orc', '5'))
+
+    assert [x.name for x in targets] == ['Frodo', 'orc']
+    assert amount == 5
+
+
+def test_get_targets_and_amount_too_few_args(command, capsys):
+    assert command.get_targets_and_amount(('Frodo',)) == (None, None)
+    assert "Need a target and an amount" in capsys.readouterr().out
+
+
+def test_get_targets_and_amount_invalid_amount(command, capsys):
+    assert command.get_targets_and_amount(('Frodo', 'lots')) == (None, None)
+    assert "Need an amount of HP" in capsys.readouterr().out
+
+
+def test_get_targets_and_amount_no_targets(command, capsys):
+    assert command.get_targets_and_amount(('Sauron', '5')) == (None, None)
+    assert "No targets found" in capsys.readouterr().out
@@ -24,3 +24,43 @@ def test_get_available_encounters(encounter_loader):
     assert 'goblins' in available_encounters[0].groups
     assert available_encounters[0].groups['goblins']['count'] == 4
 
+
+def test_get_available_encounter_headers(encounter_loader):
+    headers = encounter_loader.get_available_encounter_headers()
+
+    assert len(headers) == 5
+    filename, encounter = headers[0]
+    assert filename.endswith('lmop1.1.1.toml')
+    assert encounter.name == 'LMoP 1.1.1: Goblin Ambush'
+    assert encounter.location == 'Triboar Trail'
+    assert not encounter.groups
+
+
+def test_get_encounter_header_with_bracket_in_notes(tmp_path):
+    (tmp_path / 'tricky.toml').write_text(
+            'name = "Tricky"\n'
+            'location = "Anywhere"\n'
+            'notes = """\n'
+            '[not a table]\n'
+            '"""\n'
+            '\n'
+            '[groups.orcs]\n'
+            'monster = "orc"\n'
+            'count = 2\n')
+    loader = EncounterLoader(
+        base_dir=str(tmp_path),
+        monster_loader=None,
+        combat=Combat()
+    )
+
+    [(filename, encounter)] = loader.get_available_encounter_headers()
+    assert encounter.name == 'Tricky'
+    assert encounter.notes == '[not a table]\n'
+
+
+def test_load_file(encounter_loader):
+    filename, _ = encounter_loader.get_available_encounter_headers()[0]
+    encounter = encounter_loader.load_file(filename)
+
+    assert encounter.name == 'LMoP 1.1.1: Goblin Ambush'
+    assert encounter.groups['goblins']['count'] == 4
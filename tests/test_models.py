@@ -0,0 +1,39 @@
+from dndme.models import Game, Monster
+
+
+def make_game():
+    return Game(base_dir='', encounters_dir='', party_file='', log_file=None,
+            calendar=None, clock=None, almanac=None, latitude=0)
+
+
+def test_game_default_containers_not_shared():
+    game1 = make_game()
+    game2 = make_game()
+    game1.stash['orc'] = Monster(name='orc')
+
+    assert game2.stash == {}
+    assert game1.combats == [game1.combat]
+    assert game2.combats == [game2.combat]
+    assert game1.commands is not game2.commands
+
+
+def test_register_commands_resets_command_keywords():
+    class FakeCommand:
+        def __init__(self, *keywords):
+            self.keywords = keywords
+
+    game = make_game()
+    game.register_commands([FakeCommand('show')])
+    assert game.command_keywords == ['show']
+
+    game.register_commands([FakeCommand('load'), FakeCommand('heal', 'cure')])
+    assert game.command_keywords == ['cure', 'heal', 'load', 'show']
+
+
+def test_command_keywords_cache_not_in_repr_or_eq():
+    game1 = make_game()
+    game2 = make_game()
+    game1.command_keywords
+
+    assert 'command_keywords' not in repr(game1)
+    assert game1 == game2
@@ -0,0 +1,74 @@
+import pytest
+
+from dndme.loaders import MonsterLoader
+
+
+@pytest.fixture
+def monster_loader():
+    """Create a testing monster loader"""
+    return MonsterLoader()
+
+
+def test_load(monster_loader):
+    monsters = monster_loader.load('goblin', count=3)
+
+    assert len(monsters) == 3
+    assert all(monster.name == 'goblin' for monster in monsters)
+
+
+def test_load_unknown_monster(monster_loader):
+    assert monster_loader.load('tarrasque') == []
+
+
+def test_load_monsters_do_not_share_data(monster_loader):
+    first, second = monster_loader.load('goblin', count=2)
+    first.skills['stealth'] = 99
+
+    assert second.skills.get('stealth') != 99
+    assert monster_loader.load('goblin')[0].skills.get('stealth') != 99
+
+
+def test_load_rolls_max_hp(monster_loader):
+    monsters = monster_loader.load('goblin', count=5)
+
+    for monster in monsters:
+        assert 2 <= monster.max_hp <= 12
+        assert monster.cur_hp == monster.max_hp
+
+
+def test_load_max_hp_override(monster_loader):
+    monsters = monster_loader.load('goblin', count=2, max_hp=[10, 11])
+    assert [x.max_hp for x in monsters] == [10, 11]
+    assert [x.cur_hp for x in monsters] == [10, 11]
+
+    monsters = monster_loader.load('goblin', count=2, max_hp=150)
+    assert [x.max_hp for x in monsters] == [150, 150]
+
+    monsters = monster_loader.load('goblin', count=2, max_hp="2d6+3")
+    assert all(5 <= x.max_hp <= 15 for x in monsters)
+
+
+def test_monster_data_refreshes_when_files_change(tmp_path, monkeypatch):
+    monsters_dir = tmp_path / 'content' / 'test' / 'monsters'
+    monsters_dir.mkdir(parents=True)
+    (monsters_dir / 'orc.toml').write_text('name = "orc"\nmax_hp = 15\n')
+    monkeypatch.chdir(tmp_path)
+
+    monster_loader = MonsterLoader()
+    assert monster_loader.get_available_monster_keys() == ['orc']
+
+    (monsters_dir / 'hobgoblin.toml').write_text(
+            'name = "hobgoblin"\nmax_hp = 11\n')
+    assert monster_loader.get_available_monster_keys() == ['orc']
+
+    monster_loader.refresh()
+    assert monster_loader.get_available_monster_keys() == ['hobgoblin', 'orc']
+    assert len(monster_loader.load('hobgoblin')) == 1
+
+
+def test_load_does_not_rescan_files(monster_loader, monkeypatch):
+    monster_loader.refresh()
+    monkeypatch.setattr('os.scandir', None)
+
+    assert len(monster_loader.load('goblin')) == 1
+    assert len(monster_loader.load('skeleton')) == 1